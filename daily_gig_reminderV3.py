@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 import os
 import re
+import string
 import sys
 import argparse
 import time
@@ -36,10 +37,15 @@ SCOPES = ["https://www.googleapis.com/auth/spreadsheets.readonly"]
 
 ROLE_COLS = ["Vocal", "Piano", "Bass", "Drums", "Guitar", "Vibes"]
 
+def _is_hex(s: str) -> bool:
+    return all(c in string.hexdigits for c in s)
+
 def _assert_twilio_creds(sid: str, token: str):
-    if not re.fullmatch(r"AC[a-fA-F0-9]{32}", sid or ""):
+    sid = sid or ""
+    token = token or ""
+    if not (len(sid) == 34 and sid.startswith("AC") and _is_hex(sid[2:])):
         raise ValueError(f"TWILIO_SID looks malformed: {repr(sid)}")
-    if not re.fullmatch(r"[a-fA-F0-9]{32}", token or ""):
+    if not (len(token) == 32 and _is_hex(token)):
         raise ValueError("TWILIO_AUTH looks malformed (should be 32 hex chars).")
 
 _assert_twilio_creds(TWILIO_SID, TWILIO_AUTH)
@@ -161,8 +167,11 @@ def load_member_directory(gc):
 
 _SPLIT_RE = re.compile(r"\s*(?:,|/|&| and )\s*", flags=re.IGNORECASE)
 
-def extract_aliases_from_row(row: dict) -> list[str]:
-    """Collect all aliases from the role columns, split if multiple names given."""
+def extract_aliases_from_row(row: dict) -> list[tuple[str, str]]:
+    """
+    Collect all aliases from the role columns, split if multiple names given.
+    Returns (alias, alias_lc) pairs so callers can key the directory directly.
+    """
     found = []
     for col in ROLE_COLS:
         raw = str(row.get(col, "") or "").strip()
@@ -170,7 +179,7 @@ def extract_aliases_from_row(row: dict) -> list[str]:
             continue
         # Remove simple notes like "(sub)" or extra spaces
         raw = re.sub(r"\([^)]*\)", "", raw).strip()
-        parts = [p.strip() for p in _SPLIT_RE.split(raw) if p.strip()]
+        parts = [(p, p.lower()) for p in (x.strip() for x in _SPLIT_RE.split(raw)) if p]
         found.extend(parts)
     return found
 
@@ -249,25 +258,19 @@ def main():
         any_row_today = True
         print(f"\n=== 🎵 Processing row {row_idx} for {row.get('Venue','(unknown venue)')} ({row.get('Date')}) ===")
 
-        # Message text
-        time_ = str(row.get("Time", "") or "").strip()
-        venue = str(row.get("Venue", "") or "").strip()
-        location = str(row.get("Location", "") or "").strip()
-        message = f"Auto reminder: You have a gig today at {venue} ({time_}) {location}.\n—Mixed Nuts"
-
         # Gather aliases from the role columns
         print(f"DEBUG → Raw Vocal cell content: {repr(row.get('Vocal'))}")
         aliases = extract_aliases_from_row(row)
-        print(f"DEBUG → Extracted aliases: {aliases}")
+        print(f"DEBUG → Extracted aliases: {[a for a, _ in aliases]}")
 
         if not aliases:
             print("⚠️  No musician aliases found in role columns for this row.")
             continue
 
         sent_to = set()
-        for alias in aliases:
-            key = alias.lower().strip()
-            info = directory.get(key)
+        message = None  # built on first send; rows with no reachable musicians skip it
+        for alias, alias_lc in aliases:
+            info = directory.get(alias_lc)
 
             if not info:
                 print(f"⚠️  Alias not found in BandMembers → '{alias}' (check spelling or spacing).")
@@ -284,6 +287,12 @@ def main():
                 print(f"⚠️  Duplicate alias '{alias}' in this row — skipping repeat.")
                 continue
 
+            if message is None:
+                time_ = str(row.get("Time", "") or "").strip()
+                venue = str(row.get("Venue", "") or "").strip()
+                location = str(row.get("Location", "") or "").strip()
+                message = f"Auto reminder: You have a gig today at {venue} ({time_}) {location}.\n—Mixed Nuts"
+
             # Success — sending or simulating
             if TEST_MODE:
                 print(f"🧪 TEST MODE: would send to {info['Alias']} at {phone}, redirecting to {TEST_PHONE}")
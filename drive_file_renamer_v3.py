@@ -5,99 +5,46 @@ drive_file_rename_v3.py
 ───────────────────────────────────────────────────────────────
 Interactive bulk renamer for Google Drive files.
 Adds confirmation step after dry-run (reuses inputs if user says "y").
+Drive access and rename logic live in drive_renamer_core.py.
 """
 
-import csv
 import re
 import sys
 from datetime import datetime
 from pathlib import Path
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-
-SCOPES = ["https://www.googleapis.com/auth/drive"]
-CREDS_PATH = Path("/home/keith/PythonProjects/projects/Mixed_Nuts/config/credentials.json")
-TOKEN_PATH = CREDS_PATH.with_name("token_drive_renamer.json")
-
-# ──────────────────────────────────────────────────────────────
-def get_drive_service():
-    creds = None
-    if TOKEN_PATH.exists():
-        creds = Credentials.from_authorized_user_file(TOKEN_PATH, SCOPES)
-    if not creds or not creds.valid:
-        flow = InstalledAppFlow.from_client_secrets_file(str(CREDS_PATH), SCOPES)
-        creds = flow.run_local_server(port=0)
-        TOKEN_PATH.write_text(creds.to_json())
-    return build("drive", "v3", credentials=creds)
-
-def find_folder_id(svc, name):
-    q = f"name = '{name}' and mimeType = 'application/vnd.google-apps.folder' and trashed = false"
-    res = svc.files().list(q=q, fields="files(id,name)").execute()
-    if not res["files"]:
-        print(f"❌ Folder not found: {name}")
-        sys.exit(1)
-    return res["files"][0]["id"]
-
-def list_files(svc, folder_id, mime=None):
-    allf, token = [], None
-    while True:
-        q = f"'{folder_id}' in parents and trashed = false"
-        if mime:
-            q += f" and mimeType='{mime}'"
-        r = svc.files().list(
-            q=q, fields="nextPageToken,files(id,name)", pageSize=100, pageToken=token
-        ).execute()
-        allf += r.get("files", [])
-        token = r.get("nextPageToken")
-        if not token:
-            break
-    return allf
+from drive_renamer_core import (
+    Renamer, apply_renames, find_collisions, find_folder_id, get_drive_service, list_files
+)
 
 # ──────────────────────────────────────────────────────────────
-def transform_name(old, mode, search, replace, prefix, suffix, case, use_regex):
-    if mode == "replace":
-        flags = 0 if use_regex else re.IGNORECASE
-        pat = re.compile(search, flags)
-        return pat.sub(replace, old)
-    if mode == "prefix":
-        return prefix + old
-    if mode == "suffix":
-        stem, ext = Path(old).stem, Path(old).suffix
-        return f"{stem}{suffix}{ext}"
-    if mode == "case":
-        if case == "upper": return old.upper()
-        if case == "lower": return old.lower()
-        if case == "title": return old.title()
-    return old
+def make_renamer(params):
+    return Renamer(
+        params["mode"], params["search"], params["replace"],
+        params["prefix"], params["suffix"], params["case"],
+        params["use_regex"]
+    )
 
-# ──────────────────────────────────────────────────────────────
-def rename_files(svc, files, mode, search, replace, prefix, suffix, case, use_regex, dry_run):
+def log_path(dry_run):
     timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-    logpath = Path(f"drive_renames_{'dryrun' if dry_run else 'final'}_{timestamp}.csv")
-    changed = []
-
-    for f in files:
-        new = transform_name(f["name"], mode, search, replace, prefix, suffix, case, use_regex)
-        if new != f["name"]:
-            print(f"{f['name']}  →  {new}")
-            changed.append((f["id"], f["name"], new))
-            if not dry_run:
-                try:
-                    svc.files().update(fileId=f["id"], body={"name": new}).execute()
-                except HttpError as e:
-                    print(f"⚠️  Failed: {e}")
-    # Log
-    if changed:
-        with open(logpath, "w", newline="", encoding="utf-8") as c:
-            w = csv.writer(c)
-            w.writerow(["file_id", "old_name", "new_name"])
-            w.writerows(changed)
-        print(f"\n📝  Log saved to {logpath}")
-    else:
-        print("No changes made.")
-    return len(changed)
+    return Path(f"drive_renames_{'dryrun' if dry_run else 'final'}_{timestamp}.csv")
+
+def preview_renames(files, renamer):
+    """Dry run: print and log the proposed renames and return them for the real run."""
+    proposed = list(renamer.changes(files))
+
+    # Settle collisions first, so the preview and dry-run log match what a real run does
+    collisions = find_collisions(files, proposed)
+    if collisions:
+        print(f"⚠️  {len(collisions)} rename(s) would duplicate a name already in the folder:")
+        for _, old, new in collisions:
+            print(f"   {old}  →  {new}")
+        if input("Skip these renames? (y/n): ").strip().lower() != "n":
+            skip = {fid for fid, _, _ in collisions}
+            proposed = [p for p in proposed if p[0] not in skip]
+        print()
+
+    apply_renames(None, proposed, log_path(dry_run=True), dry_run=True)
+    return proposed
 
 # ──────────────────────────────────────────────────────────────
 def gather_inputs():
@@ -130,23 +77,26 @@ def gather_inputs():
 
 # ──────────────────────────────────────────────────────────────
 def main():
-    svc = get_drive_service()
     params = gather_inputs()
+    try:
+        renamer = make_renamer(params)
+    except re.error as e:
+        print(f"Invalid regex: {e}")
+        sys.exit(2)
+    if renamer.is_noop:
+        print("No-op configuration; nothing to do.")
+        return
 
+    svc = get_drive_service()
     fid = find_folder_id(svc, params["folder"])
     files = list_files(svc, fid, params["mime"])
     print(f"\nFound {len(files)} files in '{params['folder']}'.\n")
 
     # Step 1: Always do dry-run first
     print("💡 Previewing proposed changes (dry run)...\n")
-    count = rename_files(
-        svc, files,
-        params["mode"], params["search"], params["replace"],
-        params["prefix"], params["suffix"], params["case"],
-        params["use_regex"], dry_run=True
-    )
+    proposed = preview_renames(files, renamer)
 
-    if count == 0:
+    if not proposed:
         print("\nNothing to rename.")
         return
 
@@ -157,6 +107,7 @@ def main():
             return
         elif choice == "edit":
             print("\nRe-enter parameters (press Enter to keep current):")
+            old_source = (params["folder"], params["mime"])
             for k, v in list(params.items()):
                 if k in ["use_regex"]:  # boolean, handle separately
                     cont = input(f"{k.replace('_',' ')} [{ 'y' if v else 'n' }]: ").strip().lower()
@@ -164,15 +115,33 @@ def main():
                 else:
                     newv = input(f"{k.replace('_',' ')} [{v or ''}]: ").strip()
                     if newv: params[k] = newv
+            if (params["folder"], params["mime"]) != old_source:
+                fid = find_folder_id(svc, params["folder"])
+                files = list_files(svc, fid, params["mime"])
+                print(f"\nFound {len(files)} files in '{params['folder']}'.\n")
+
+            # The earlier preview no longer applies; until a new one is made, 'y' is refused
+            proposed = None
+            try:
+                renamer = make_renamer(params)
+            except re.error as e:
+                print(f"Invalid regex: {e} — choose 'edit' to fix it.")
+                continue
+            if renamer.is_noop:
+                print("No-op configuration — choose 'edit' to change it.")
+                continue
+            print("💡 Previewing updated changes (dry run)...\n")
+            proposed = preview_renames(files, renamer)
+            if not proposed:
+                print("\nNothing to rename.")
+                return
             continue
         elif choice == "y":
+            if proposed is None:
+                print("No valid preview yet — choose 'edit' to fix the settings, or 'n'.")
+                continue
             print("\n🚀 Performing real rename operation...\n")
-            rename_files(
-                svc, files,
-                params["mode"], params["search"], params["replace"],
-                params["prefix"], params["suffix"], params["case"],
-                params["use_regex"], dry_run=False
-            )
+            apply_renames(svc, proposed, log_path(dry_run=False))
             print("\n✅ Rename complete.")
             return
         else:
@@ -24,6 +24,7 @@ from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
+from drive_renamer_core import q_escape
 
 # ──────────────────────────────────────────────────────────────
 SCOPES = ["https://www.googleapis.com/auth/drive"]
@@ -70,7 +71,7 @@ def find_folder_id(svc, name):
         q = (
             f"mimeType = 'application/vnd.google-apps.folder' "
             f"and trashed = false "
-            f"and name contains '{name}'"
+            f"and name contains '{q_escape(name)}'"
         )
         res = svc.files().list(q=q, fields="files(id,name)").execute()
         folders = res.get("files", [])
@@ -99,9 +100,9 @@ def find_folder_id(svc, name):
 def list_files(svc, folder_id, mime=None):
     allf, token = [], None
     while True:
-        q = f"'{folder_id}' in parents and trashed = false"
+        q = f"'{q_escape(folder_id)}' in parents and trashed = false"
         if mime:
-            q += f" and mimeType contains '{mime}'"
+            q += f" and mimeType contains '{q_escape(mime)}'"
         r = svc.files().list(
             q=q, fields="nextPageToken,files(id,name)", pageSize=100, pageToken=token
         ).execute()
@@ -148,7 +149,7 @@ def rename_files(svc, files, mode, search, replace, prefix, suffix, case, use_re
             changed.append((f["id"], old_name, new))
             if not dry_run:
                 try:
-                    svc.files().update(fileId=f["id"], body={"name": new}).execute()
+                    svc.files().update(fileId=f["id"], body={"name": new}, fields="id").execute()
                 except HttpError as e:
                     print(f"⚠️  Failed: {e}")
 
@@ -189,7 +190,7 @@ def undo_from_log(svc, log_file):
 
     for r in rows:
         try:
-            svc.files().update(fileId=r["file_id"], body={"name": r["old_name"]}).execute()
+            svc.files().update(fileId=r["file_id"], body={"name": r["old_name"]}, fields="id").execute()
         except HttpError as e:
             print(f"⚠️  Failed to restore {r['new_name']}: {e}")
 
@@ -15,17 +15,39 @@ Features:
   • Optional filename filter for prefix/suffix/case modes
   • Smart folder lookup (exact → startswith → limited partial)
   • Interactive regex help, examples, and validation
+  • Folder ids and listings cached for a few minutes (--no-cache to skip)
+  • Interrupted renames can be picked up again with --resume
+  • Each log gets a .sha256 sidecar; undo refuses a log that has changed
 """
 
+import argparse
 import csv
+import functools
+import gzip
+import hashlib
+import json
+import os
 import re
+import sqlite3
 import sys
+import time
+from contextlib import closing
 from datetime import datetime
 from pathlib import Path
+import google_auth_httplib2
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from googleapiclient.http import build_http, set_user_agent
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
+from drive_renamer_core import (
+    BATCH_SIZE, PREVIEW_FLUSH_LINES, batch_rename, ireplace, json_model, q_escape, with_retry,
+)
+
+try:
+    import re2  # optional (google-re2): linear-time matching for user regexes
+except ImportError:
+    re2 = None
 
 # ──────────────────────────────────────────────────────────────
 SCOPES = ["https://www.googleapis.com/auth/drive"]
@@ -33,6 +55,10 @@ CREDS_PATH = Path("/home/keith/PythonProjects/projects/Mixed_Nuts/config/credent
 TOKEN_PATH = CREDS_PATH.with_name("token_drive_renamer.json")
 LOG_DIR = Path(CREDS_PATH).parent / "logs" / "drive_renamer"
 LOG_DIR.mkdir(parents=True, exist_ok=True)
+CACHE_DB = LOG_DIR.parent / "cache.sqlite"
+CACHE_TTL = 300  # seconds; listings older than this are fetched again
+FOLDER_TTL = 24 * 3600  # folder ids rarely change; past CACHE_TTL they're re-checked with one get
+use_cache = True
 
 # ──────────────────────────────────────────────────────────────
 def get_drive_service():
@@ -43,7 +69,10 @@ def get_drive_service():
         flow = InstalledAppFlow.from_client_secrets_file(str(CREDS_PATH), SCOPES)
         creds = flow.run_local_server(port=0)
         TOKEN_PATH.write_text(creds.to_json())
-    return build("drive", "v3", credentials=creds)
+    # Google's servers only gzip some responses when the user agent says "gzip"
+    http = set_user_agent(google_auth_httplib2.AuthorizedHttp(creds, http=build_http()),
+                          "mixed-nuts-drive-renamer/7 (gzip)")
+    return build("drive", "v3", http=http, model=json_model())
 
 # ──────────────────────────────────────────────────────────────
 def show_primer():
@@ -86,25 +115,121 @@ def explain_regex(pattern: str):
     found = [f"   {k:<6} → {desc}" for k, desc in explanations.items() if k in pattern]
     return "\n".join(found) if found else "   (No special regex tokens detected)"
 
+# ──────────────────────────────────────────────────────────────
+# Local cache (SQLite) for folder ids and listings
+# ──────────────────────────────────────────────────────────────
+_cache_ready = False  # schema created by this process yet?
+
+def cache_db():
+    global _cache_ready
+    conn = sqlite3.connect(CACHE_DB)
+    if not _cache_ready:
+        conn.executescript("""
+            CREATE TABLE IF NOT EXISTS folder_ids (
+                name TEXT PRIMARY KEY, id TEXT, folder_name TEXT, fetched_at REAL);
+            CREATE TABLE IF NOT EXISTS folder_listings (
+                folder_id TEXT, mime TEXT, payload BLOB, fetched_at REAL,
+                PRIMARY KEY (folder_id, mime));
+        """)
+        _cache_ready = True
+    return conn
+
+def cache_get(sql, key, ttl=CACHE_TTL):
+    """The cached row if it is younger than `ttl`; None on a miss, an expired row, or --no-cache."""
+    if not use_cache:
+        return None
+    try:
+        with closing(cache_db()) as conn:
+            return conn.execute(sql, key + (time.time() - ttl,)).fetchone()
+    except sqlite3.Error:
+        return None
+
+def cache_put(sql, row):
+    if not use_cache:
+        return
+    try:
+        with closing(cache_db()) as conn, conn:
+            conn.execute(sql, row + (time.time(),))
+    except sqlite3.Error as e:
+        print(f"⚠️ Could not update cache: {e}")
+
+def forget_listings(folder_id=None):
+    """Drop cached listings after a rename or undo, so the next run sees the new names."""
+    try:
+        with closing(cache_db()) as conn, conn:
+            if folder_id:
+                conn.execute("DELETE FROM folder_listings WHERE folder_id = ?", (folder_id,))
+            else:
+                conn.execute("DELETE FROM folder_listings")
+    except sqlite3.Error:
+        pass
+
 # ──────────────────────────────────────────────────────────────
 def find_folder_id(svc, name):
-    """Smart folder lookup: exact → startswith → contains (limited)."""
+    """
+    Folder lookup through the local cache, falling back to Drive. Only exact name
+    matches are cached; a folder picked from a partial-match list is asked for again
+    on every run, so a half-typed name never silently reuses an earlier pick.
+    """
+    key = name.strip().lower()
+    row = cache_get("SELECT id, folder_name, fetched_at FROM folder_ids WHERE name = ? AND fetched_at > ?",
+                    (key,), FOLDER_TTL)
+    if row:
+        fid, folder_name, fetched_at = row
+        if time.time() - fetched_at < CACHE_TTL or folder_matches(svc, fid, key):
+            print(f"\n📁 Using folder: {folder_name} (ID: {fid}, cached)")
+            cache_put("INSERT OR REPLACE INTO folder_ids VALUES (?, ?, ?, ?)", (key, fid, folder_name))
+            return fid
+    fid, folder_name, exact = lookup_folder_id(svc, name)
+    if exact:
+        cache_put("INSERT OR REPLACE INTO folder_ids VALUES (?, ?, ?, ?)", (key, fid, folder_name))
+    return fid
+
+def folder_matches(svc, fid, key):
+    """
+    One cheap get instead of a folder search: is the cached id still a live folder
+    with the name that was typed? A renamed folder is looked up again, so the name
+    isn't left pointing at whatever the old folder is called now.
+    """
+    try:
+        meta = with_retry(svc.files().get(fileId=fid, fields="id,name,trashed").execute)
+    except HttpError:
+        return False  # deleted or no longer shared
+    return not meta.get("trashed") and meta.get("name", "").lower() == key
+
+def lookup_folder_id(svc, name):
+    """
+    Smart folder lookup: exact → startswith → contains (limited).
+    Returns (id, folder name, whether it was an exact match).
+    """
     name = name.strip()
     name_lower = name.lower()
-    q = "mimeType = 'application/vnd.google-apps.folder' and trashed = false"
-    res = svc.files().list(q=q, fields="files(id,name)").execute()
-    folders = res.get("files", [])
-
-    # Exact
-    exact = [f for f in folders if f["name"].lower() == name_lower]
-    if exact:
-        fid = exact[0]["id"]
-        print(f"\n✅ Found exact match: {exact[0]['name']}")
-        print(f"📁 Using folder: {exact[0]['name']} (ID: {fid})")
-        return fid
+    esc = q_escape(name)
+    q = ("mimeType = 'application/vnd.google-apps.folder' and trashed = false"
+         f" and (name = '{esc}' or name contains '{esc}')")
+    # One paged query feeds all three tiers; exact stops paging as soon as one turns up
+    list_req = svc.files().list
+    start_matches, matches, token = [], [], None
+    while True:
+        res = with_retry(list_req(
+            q=q, fields="nextPageToken,files(id,name)", pageSize=1000,
+            spaces="drive", corpora="user", pageToken=token
+        ).execute)
+        for f in res.get("files", []):
+            folder_lower = f["name"].lower()
+            if folder_lower == name_lower:
+                print(f"\n✅ Found exact match: {f['name']}")
+                print(f"📁 Using folder: {f['name']} (ID: {f['id']})")
+                return f["id"], f["name"], True
+            if folder_lower.startswith(name_lower):
+                start_matches.append(f)
+            elif len(matches) < 5:
+                matches.append(f)
+        token = res.get("nextPageToken")
+        if not token:
+            break
 
     # Startswith
-    start_matches = [f for f in folders if f["name"].lower().startswith(name_lower)]
     if start_matches:
         print("\n✅ Found close match (starts with):")
         for i, f in enumerate(start_matches, 1):
@@ -113,15 +238,12 @@ def find_folder_id(svc, name):
         if choice.isdigit() and 1 <= int(choice) <= len(start_matches):
             sel = start_matches[int(choice) - 1]
             print(f"\n📁 Using folder: {sel['name']} (ID: {sel['id']})")
-            return sel["id"]
+            return sel["id"], sel["name"], False
         else:
             print("Operation cancelled.")
             sys.exit(0)
 
-    # Contains fallback
-    q = f"name contains '{name}' and mimeType = 'application/vnd.google-apps.folder' and trashed = false"
-    res = svc.files().list(q=q, fields="files(id,name)").execute()
-    matches = res.get("files", [])[:5]
+    # Contains (limited)
     if matches:
         print("\n⚠️ No exact match found; showing closest partial matches:")
         for i, f in enumerate(matches, 1):
@@ -130,7 +252,7 @@ def find_folder_id(svc, name):
         if choice.isdigit() and 1 <= int(choice) <= len(matches):
             sel = matches[int(choice) - 1]
             print(f"\n📁 Using folder: {sel['name']} (ID: {sel['id']})")
-            return sel["id"]
+            return sel["id"], sel["name"], False
         else:
             print("Operation cancelled.")
             sys.exit(0)
@@ -139,71 +261,192 @@ def find_folder_id(svc, name):
     sys.exit(0)
 
 # ──────────────────────────────────────────────────────────────
-def list_files(svc, folder_id, mime=None):
-    files, token = [], None
+def iter_files(svc, folder_id, mime=None):
+    """
+    Yield the folder's files page by page, letting Drive apply the MIME filter.
+    The filename filter stays client-side: Drive's `name contains` only matches
+    from the start of a word, so it would drop mid-word matches like "Setlist2024".
+    """
+    q_parts = [f"'{q_escape(folder_id)}' in parents", "trashed = false"]
+    if mime:
+        q_parts.append(f"mimeType contains '{q_escape(mime)}'")
+    q = " and ".join(q_parts)
+
+    list_req = svc.files().list
+    token = None
     while True:
-        q = f"'{folder_id}' in parents and trashed = false"
-        if mime:
-            q += f" and mimeType contains '{mime}'"
-        r = svc.files().list(q=q, fields="nextPageToken,files(id,name)", pageSize=100, pageToken=token).execute()
-        files += r.get("files", [])
+        r = with_retry(list_req(q=q, fields="nextPageToken,files(id,name)", pageSize=1000, pageToken=token).execute)
+        yield from r.get("files", [])
         token = r.get("nextPageToken")
         if not token:
             break
+
+def list_files(svc, folder_id, mime=None):
+    """
+    The whole listing as a list, through the local cache. The rename flow walks it
+    more than once (preview, then the real run), so it is held rather than streamed.
+    """
+    key = (folder_id, mime or "")
+    row = cache_get(
+        "SELECT payload FROM folder_listings WHERE folder_id = ? AND mime = ? AND fetched_at > ?", key)
+    if row:
+        return json.loads(gzip.decompress(row[0]))
+
+    files = list(iter_files(svc, folder_id, mime))
+    cache_put("INSERT OR REPLACE INTO folder_listings VALUES (?, ?, ?, ?)",
+              key + (gzip.compress(json.dumps(files).encode()),))
     return files
 
 # ──────────────────────────────────────────────────────────────
-def transform_name(old, mode, search, replace, prefix, suffix, case, use_regex):
-    if mode == "replace":
-        flags = 0 if use_regex else re.IGNORECASE
-        pat = re.compile(search, flags)
-        return pat.sub(replace, old)
+def compile_regex(pattern):
+    r"""
+    Compile with re2 when it is installed, so a pathological pattern can't backtrack
+    for minutes on a long filename. Patterns re2 doesn't support (lookaround,
+    backreferences) fall back to Python's re.
+
+    The two engines differ on non-ASCII names: re2's \d, \w and \s are ASCII-only,
+    while re's also match e.g. 'é' or '٣'. Use explicit classes such as [0-9] when
+    that matters. Validation (gather_inputs), the preview and the real run all
+    compile through here, so they always agree.
+    """
+    if re2 is not None:
+        try:
+            return re2.compile(pattern)
+        except re2.error:
+            pass
+    return re.compile(pattern)
+
+def make_transformer(mode, search, replace, prefix, suffix, case, use_regex):
+    """
+    Build the old-name → new-name function once, so the per-file loop does no setup.
+    Where a C-level callable does the job (bound methods, partials) it is returned
+    as-is rather than wrapped in a lambda.
+    """
+    if mode == "replace" and search is not None:
+        if use_regex:
+            return functools.partial(compile_regex(search).sub, replace)
+        if search.lower() == search.upper():
+            # Nothing in the search text has case, so a plain replace is already case-insensitive
+            return lambda old: old.replace(search, replace) if search else old
+        return lambda old: ireplace(old, search, replace)
     if mode == "prefix":
-        return prefix + old
+        return prefix.__add__
     if mode == "suffix":
-        stem, ext = Path(old).stem, Path(old).suffix
-        return f"{stem}{suffix}{ext}"
-    if mode == "case":
-        if case == "upper": return old.upper()
-        if case == "lower": return old.lower()
-        if case == "title": return old.title()
-    return old
+        def add_suffix(old):
+            stem, dot, ext = old.rpartition(".")
+            if not stem:  # no extension, or a dot-file like ".env"
+                return old + suffix
+            return f"{stem}{suffix}.{ext}"
+        return add_suffix
+    if mode == "case" and case in ("upper", "lower", "title"):
+        return getattr(str, case)
+    return str  # identity for names, which are already str
 
 # ──────────────────────────────────────────────────────────────
-def rename_files(svc, files, mode, search, replace, prefix, suffix, case, use_regex, filter_str, dry_run):
+def rename_files(svc, files, mode, search, replace, prefix, suffix, case, use_regex, filter_str, dry_run,
+                 resume_log=None):
     timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
     logpath = LOG_DIR / f"drive_renames_final_{timestamp}.csv"
-    changed = []
+    inprogress = logpath.with_name(logpath.name + ".inprogress")
+    count, pending = 0, {}
+    xform = make_transformer(mode, search, replace, prefix, suffix, case, use_regex)
 
+    log_file = w = None
+    preview = []  # dry-run lines, written in chunks; real runs print as they go
     if dry_run:
         print("────────── Dry Run Preview (no changes made) ──────────")
+    else:
+        # Confirmed renames go straight to the log, so an interrupted run keeps its undo
+        # record; it stays *.inprogress until every batch is through, for --resume
+        if resume_log:
+            inprogress = Path(resume_log)
+            logpath = inprogress.with_suffix("")
+            log_file = open(inprogress, "a", newline="", encoding="utf-8", buffering=1 << 20)
+            w = csv.writer(log_file)
+        else:
+            log_file = open(inprogress, "w", newline="", encoding="utf-8", buffering=1 << 20)
+            w = csv.writer(log_file)
+            w.writerow(["file_id", "old_name", "new_name"])
+
+    needle = filter_str.lower() if filter_str else None
+    try:
+        for f in files:
+            old = f["name"]
+            if needle and needle not in old.lower():
+                continue
+            new = xform(old)
+            if new != old:
+                if dry_run:
+                    preview.append(f"{old}  →  {new}\n")
+                    if len(preview) >= PREVIEW_FLUSH_LINES:
+                        sys.stdout.write("".join(preview))
+                        preview.clear()
+                    count += 1
+                else:
+                    print(f"{old}  →  {new}")
+                    pending[f["id"]] = (f["id"], old, new)
+                    if len(pending) >= BATCH_SIZE:
+                        count += batch_rename(svc, pending, w.writerow)
+                        log_file.flush()
+                        os.fsync(log_file.fileno())
+                        pending = {}
+        if pending:
+            count += batch_rename(svc, pending, w.writerow)
+    finally:
+        sys.stdout.write("".join(preview))
+        if log_file:
+            log_file.close()
+
+    if log_file:
+        if count or resume_log:
+            inprogress.replace(logpath)
+            write_checksum(logpath)
+        else:
+            inprogress.unlink()
 
-    for f in files:
-        old = f["name"]
-        if filter_str and filter_str.lower() not in old.lower():
-            continue
-        new = transform_name(old, mode, search, replace, prefix, suffix, case, use_regex)
-        if new != old:
-            print(f"{old}  →  {new}")
-            changed.append((f["id"], old, new))
-            if not dry_run:
-                try:
-                    svc.files().update(fileId=f["id"], body={"name": new}).execute()
-                except HttpError as e:
-                    print(f"⚠️ Failed: {e}")
-
-    if changed:
+    if count:
         if dry_run:
             print("\n(Dry run only — no log saved)")
         else:
-            with open(logpath, "w", newline="", encoding="utf-8") as c:
-                w = csv.writer(c)
-                w.writerow(["file_id", "old_name", "new_name"])
-                w.writerows(changed)
             print(f"\n📝 Log saved to {logpath}")
     else:
         print("No changes made.")
-    return len(changed)
+    return count
+
+# ──────────────────────────────────────────────────────────────
+def file_sha256(path):
+    with open(path, "rb") as fh:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            return hashlib.file_digest(fh, "sha256").hexdigest()
+        h = hashlib.sha256()
+        for chunk in iter(lambda: fh.read(1 << 20), b""):
+            h.update(chunk)
+        return h.hexdigest()
+
+def write_checksum(logpath):
+    """Write <log>.sha256 next to the log, in the same format sha256sum uses."""
+    logpath.with_suffix(".sha256").write_text(f"{file_sha256(logpath)}  {logpath.name}\n", encoding="utf-8")
+
+def checksum_ok(logpath):
+    """False only when a sidecar exists and the log no longer matches it."""
+    sidecar = logpath.with_suffix(".sha256")
+    try:
+        expected = sidecar.read_text(encoding="utf-8").split()[0]
+    except (OSError, IndexError):
+        return True  # older logs have no sidecar
+    return file_sha256(logpath) == expected
+
+def find_interrupted_log():
+    """Newest rename log left *.inprogress by a run that did not finish, or None."""
+    logs = sorted(LOG_DIR.glob("drive_renames_*.csv.inprogress"), key=lambda p: p.stat().st_mtime)
+    return logs[-1] if logs else None
+
+def logged_file_ids(path):
+    """Ids of the files a log records as renamed."""
+    with open(path, newline="", encoding="utf-8") as c:
+        reader = csv.reader(c)
+        next(reader, None)
+        return {r[0] for r in reader if r}
 
 # ──────────────────────────────────────────────────────────────
 def undo_from_log(svc, log_file):
@@ -211,32 +454,52 @@ def undo_from_log(svc, log_file):
     if not path.exists():
         print(f"❌ Log not found: {path}")
         return
+    if not checksum_ok(path):
+        print(f"❌ {path.name} does not match its .sha256 checksum; it was changed after the rename.")
+        print("   Undo aborted — check the log before restoring from it.")
+        return
     with open(path, newline="", encoding="utf-8") as c:
-        rows = list(csv.DictReader(c))
+        reader = csv.reader(c)
+        next(reader, None)  # header: file_id,old_name,new_name
+        rows = [(r[0], r[1], r[2]) for r in reader if len(r) >= 3]
     if not rows:
         print("No entries in log.")
         return
     print(f"\nRestoring names from: {path}")
-    for r in rows:
-        print(f"{r['new_name']} → {r['old_name']}")
+    sys.stdout.write("".join(f"{new} → {old}\n" for _, old, new in rows))
+    sys.stdout.flush()
     if input("\nProceed with undo (y/n): ").strip().lower() != "y":
         print("Undo cancelled.")
         return
-    for r in rows:
-        try:
-            svc.files().update(fileId=r["file_id"], body={"name": r["old_name"]}).execute()
-        except HttpError as e:
-            print(f"⚠️ Failed to restore {r['new_name']}: {e}")
-    print("\n✅ Undo complete.\n")
+    # Same batched, backed-off updates as a rename, just with the names swapped
+    restored, pending = 0, {}
+    for fid, old, new in rows:
+        pending[fid] = (fid, new, old)
+        if len(pending) >= BATCH_SIZE:
+            restored += batch_rename(svc, pending)
+            pending = {}
+    if pending:
+        restored += batch_rename(svc, pending)
+    print(f"\n✅ Undo complete: {restored} of {len(rows)} names restored.\n")
 
 # ──────────────────────────────────────────────────────────────
+def recent_logs():
+    """Finished rename logs, newest first, from one os.scandir pass."""
+    # DirEntry.stat() reuses what scandir already read, so there is no extra stat per file
+    with os.scandir(LOG_DIR) as it:
+        logs = [(e.stat().st_mtime, e.path) for e in it
+                if e.name.startswith("drive_renames_") and e.name.endswith(".csv") and e.is_file()]
+    logs.sort(reverse=True)
+    return [Path(path) for _, path in logs]
+
 def prune_old_logs(max_logs=10):
-    logs = sorted(LOG_DIR.glob("drive_renames_*.csv"), key=lambda p: p.stat().st_mtime, reverse=True)
+    logs = recent_logs()
     if len(logs) > max_logs:
         print(f"\n🧹 Cleaning old logs (keeping {max_logs})...")
         for p in logs[max_logs:]:
             try:
                 p.unlink()
+                p.with_suffix(".sha256").unlink(missing_ok=True)
                 print(f"   Removed {p.name}")
             except Exception as e:
                 print(f"   ⚠️ {p.name}: {e}")
@@ -277,7 +540,7 @@ def gather_inputs():
             while True:
                 search = input("Enter your regex pattern: ")
                 try:
-                    re.compile(search)
+                    compile_regex(search)  # the same engine the rename will run
                 except re.error as e:
                     print(f"⚠️ Invalid regex: {e}")
                     if input("Edit and retry? (y/n): ").strip().lower() == "y":
@@ -333,6 +596,14 @@ def gather_inputs():
 
 # ──────────────────────────────────────────────────────────────
 def main():
+    global use_cache
+    ap = argparse.ArgumentParser(description="Interactive bulk renamer for Google Drive files.")
+    ap.add_argument("--no-cache", action="store_true", help="ignore cached folder ids and listings")
+    ap.add_argument("--resume", action="store_true",
+                    help="continue the last interrupted rename, skipping files it already renamed")
+    args = ap.parse_args()
+    use_cache = not args.no_cache
+
     svc = get_drive_service()
     prune_old_logs(max_logs=10)
 
@@ -344,7 +615,7 @@ def main():
         return
 
     elif op == "undo":
-        logs = sorted(LOG_DIR.glob("drive_renames_*.csv"), key=lambda p: p.stat().st_mtime, reverse=True)
+        logs = recent_logs()
         if not logs:
             print(f"No log files found in {LOG_DIR}")
             return
@@ -358,13 +629,26 @@ def main():
             return
         log_file = logs[int(c)-1] if c.isdigit() and 1 <= int(c) <= len(logs[:5]) else Path(c)
         undo_from_log(svc, log_file)
+        forget_listings()
         return
 
     elif op == "rename":
+        resume_log = find_interrupted_log()
+        if resume_log and not args.resume:
+            print(f"\n⚠️ An earlier rename did not finish: {resume_log.name}")
+            print("   Run again with --resume to skip the files it already renamed.")
+            resume_log = None
+        elif args.resume and not resume_log:
+            print("\nNo interrupted rename to resume; starting fresh.")
+
         params = gather_inputs()
         fid = find_folder_id(svc, params["folder"])
         files = list_files(svc, fid, params["mime"])
         print(f"\nFound {len(files)} files in '{params['folder']}'.\n")
+        if resume_log:
+            done = logged_file_ids(resume_log)
+            files = [f for f in files if f["id"] not in done]
+            print(f"⏯️  Resuming {resume_log.name}: {len(done)} already renamed, {len(files)} left to check.\n")
 
         print("💡 Previewing proposed changes (dry run)...\n")
         count = rename_files(
@@ -384,6 +668,7 @@ def main():
                 return
             elif choice == "edit":
                 print("\nRe-enter parameters (Enter=keep current):")
+                old_query = (params["folder"], params["mime"])
                 for k, v in list(params.items()):
                     if k in ["use_regex"]:
                         cont = input(f"{k} [{'y' if v else 'n'}]: ").strip().lower()
@@ -398,6 +683,16 @@ def main():
                         if newv:
                             params[k] = newv
 
+                # The listing was filtered by MIME type server-side, so a new folder
+                # or type needs a new listing; filter_str is applied per preview
+                if (params["folder"], params["mime"]) != old_query:
+                    if params["folder"] != old_query[0]:
+                        fid = find_folder_id(svc, params["folder"])
+                    files = list_files(svc, fid, params["mime"])
+                    print(f"\nFound {len(files)} files in '{params['folder']}'.\n")
+                    if resume_log:
+                        files = [f for f in files if f["id"] not in done]
+
                 print("\n💡 Previewing updated changes (dry run)...\n")
                 count = rename_files(
                     svc, files,
@@ -412,11 +707,13 @@ def main():
 
             elif choice == "y":
                 print("\n🚀 Performing real rename operation...\n")
+                forget_listings(fid)  # before renaming, so an interrupted run can't leave a stale listing
                 rename_files(
                     svc, files,
                     params["mode"], params["search"], params["replace"],
                     params["prefix"], params["suffix"], params["case"],
-                    params["use_regex"], params["filter_str"], dry_run=False
+                    params["use_regex"], params["filter_str"], dry_run=False,
+                    resume_log=resume_log
                 )
                 print("\n✅ Rename complete.")
                 return
@@ -0,0 +1,361 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+drive_renamer_core.py
+───────────────────────────────────────────────────────────────
+Shared Google Drive plumbing for drive_file_renamer_v1/v2/v3
+(v7 uses the batch and retry helpers).
+
+  • OAuth service setup (reuses token, refreshes when expired)
+  • Folder lookup, cached in memory and in folder_id_cache.json
+  • Folder listing
+  • Renamer: one rename configuration, compiled once, applied with
+    batched updates and a streamed CSV log
+"""
+
+import csv
+import functools
+import json
+import os
+import random
+import re
+import sys
+import time
+from pathlib import Path
+from google.auth.transport.requests import Request
+from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
+from googleapiclient.model import JsonModel
+from google.oauth2.credentials import Credentials
+from google_auth_oauthlib.flow import InstalledAppFlow
+
+try:
+    import orjson  # optional: faster token and API response parsing
+except ImportError:
+    orjson = None
+
+SCOPES = ["https://www.googleapis.com/auth/drive"]
+CREDS_PATH = Path("/home/keith/PythonProjects/projects/Mixed_Nuts/config/credentials.json")
+TOKEN_PATH = CREDS_PATH.with_name("token_drive_renamer.json")
+FOLDER_CACHE = TOKEN_PATH.with_name("folder_id_cache.json")
+
+BATCH_SIZE = 25  # Drive allows 100 per batch, but large update batches tend to come back as 500s
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+RATE_LIMIT_REASONS = {"rateLimitExceeded", "userRateLimitExceeded"}  # the only retryable 403s
+PREVIEW_FLUSH_LINES = 500
+
+# ──────────────────────────────────────────────────────────────
+# Authentication
+# ──────────────────────────────────────────────────────────────
+def load_token():
+    raw = TOKEN_PATH.read_bytes()
+    info = orjson.loads(raw) if orjson else json.loads(raw)
+    return Credentials.from_authorized_user_info(info, SCOPES)
+
+def get_drive_service():
+    creds = None
+    if TOKEN_PATH.exists():
+        creds = load_token()
+    if not creds or not creds.valid:
+        if creds and creds.expired and creds.refresh_token:
+            creds.refresh(Request())
+        else:
+            flow = InstalledAppFlow.from_client_secrets_file(str(CREDS_PATH), SCOPES)
+            creds = flow.run_local_server(port=0)
+        TOKEN_PATH.write_text(creds.to_json())
+    return build("drive", "v3", credentials=creds, model=json_model())
+
+class OrjsonModel(JsonModel):
+    """JsonModel that parses response bodies with orjson (204s never reach deserialize)."""
+
+    def deserialize(self, content):
+        body = orjson.loads(content)
+        if self._data_wrapper and isinstance(body, dict) and "data" in body:
+            body = body["data"]
+        return body
+
+def json_model():
+    """Response model for build(): orjson-backed when available, else the library default."""
+    return OrjsonModel() if orjson else None
+
+# ──────────────────────────────────────────────────────────────
+# Drive helpers
+# ──────────────────────────────────────────────────────────────
+def backoff(attempt):
+    """Truncated exponential backoff with jitter."""
+    time.sleep(min(2 ** attempt + random.random(), 32))
+
+def error_reasons(e):
+    """The `reason` strings Drive attached to an HttpError."""
+    details = getattr(e, "error_details", None)
+    if not isinstance(details, list):
+        try:
+            details = json.loads(e.content)["error"]["errors"]
+        except (AttributeError, TypeError, ValueError, KeyError):
+            return set()
+    return {d.get("reason") for d in details if isinstance(d, dict)}
+
+def is_retryable(e):
+    """Rate-limit and server errors; a 403 only counts when it is a rate limit."""
+    status = e.resp.status
+    if status == 403:
+        return bool(error_reasons(e) & RATE_LIMIT_REASONS)
+    return status in RETRY_STATUSES
+
+def with_retry(fn, max_attempts=6):
+    """Call fn(), retrying rate-limit and server errors; other errors are raised."""
+    for attempt in range(max_attempts):
+        try:
+            return fn()
+        except HttpError as e:
+            if not is_retryable(e) or attempt == max_attempts - 1:
+                raise
+            backoff(attempt)
+
+def q_escape(s):
+    """Escape a value for use inside a quoted Drive `q` string."""
+    return s.replace("\\", "\\\\").replace("'", "\\'")
+
+def load_folder_cache():
+    try:
+        return json.loads(FOLDER_CACHE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+@functools.lru_cache(maxsize=128)
+def find_folder_id(svc, name):
+    """
+    Resolve a folder name to its id, using the on-disk cache while that id is still
+    a live folder with the same name (a renamed folder is looked up again).
+    """
+    cache = load_folder_cache()
+    cached_id = cache.get(name)
+    if cached_id:
+        try:
+            meta = with_retry(svc.files().get(fileId=cached_id, fields="id,name,trashed").execute)
+            if not meta.get("trashed") and meta.get("name") == name:
+                return cached_id
+        except HttpError:
+            pass  # deleted or no longer shared; fall back to a fresh lookup
+
+    q = f"name = '{q_escape(name)}' and mimeType = 'application/vnd.google-apps.folder' and trashed = false"
+    res = with_retry(svc.files().list(q=q, fields="files(id,name)").execute)
+    if not res["files"]:
+        print(f"❌ Folder not found: {name}")
+        sys.exit(1)
+    fid = res["files"][0]["id"]
+    cache[name] = fid
+    try:
+        FOLDER_CACHE.write_text(json.dumps(cache, indent=2), encoding="utf-8")
+    except OSError as e:
+        print(f"⚠️  Could not save folder cache: {e}")
+    return fid
+
+def iter_files(svc, folder_id, mime=None):
+    """Yield the folder's files page by page, so only one page is held at a time."""
+    q = f"'{q_escape(folder_id)}' in parents and trashed = false"
+    if mime:
+        q += f" and mimeType='{q_escape(mime)}'"
+    token = None
+    while True:
+        r = with_retry(svc.files().list(
+            q=q, fields="nextPageToken,files(id,name)", pageSize=1000, pageToken=token
+        ).execute)
+        yield from r.get("files", [])
+        token = r.get("nextPageToken")
+        if not token:
+            break
+
+def list_files(svc, folder_id, mime=None):
+    """
+    All files at once, for callers that go over the listing more than once or
+    rename what they list. Drive's page tokens aren't stable while the folder
+    changes, so renaming before the last page is in can skip files or repeat them.
+    """
+    return list(iter_files(svc, folder_id, mime))
+
+def batch_rename(svc, pending, on_success=None, max_attempts=5):
+    """
+    Send queued renames {request_id: (file_id, old, new)} as one batch request.
+    Each confirmed rename is passed to `on_success` (e.g. a csv writer's
+    writerow); rate-limit and server errors are retried with truncated
+    exponential backoff, for single requests and for the batch as a whole.
+    Returns the number of files renamed.
+    """
+    done = 0
+    update = svc.files().update
+    for attempt in range(max_attempts):
+        retry = {}
+
+        def on_done(request_id, response, exception):
+            nonlocal done
+            entry = pending[request_id]
+            if exception is None:
+                if on_success:
+                    on_success(entry)
+                done += 1
+            elif isinstance(exception, HttpError) and is_retryable(exception):
+                retry[request_id] = entry
+            else:
+                print(f"⚠️  Failed: {entry[1]}: {exception}", file=sys.stderr)
+
+        batch = svc.new_batch_http_request(callback=on_done)
+        for request_id, (fid, _, new) in pending.items():
+            batch.add(update(fileId=fid, body={"name": new}, fields="id"), request_id=request_id)
+        try:
+            batch.execute()
+        except HttpError as e:
+            if not is_retryable(e):
+                for _, old, _ in pending.values():
+                    print(f"⚠️  Failed: {old}: {e}", file=sys.stderr)
+                return done
+            retry = dict(pending)  # the batch itself was refused, so none of it went through
+
+        if not retry:
+            return done
+        pending = retry
+        backoff(attempt)
+
+    for _, old, _ in pending.values():
+        print(f"⚠️  Failed after {max_attempts} attempts: {old}", file=sys.stderr)
+    return done
+
+# ──────────────────────────────────────────────────────────────
+# Rename logic
+# ──────────────────────────────────────────────────────────────
+def ireplace(hay, needle, repl):
+    """Case-insensitive literal replace without going through the regex engine."""
+    if not needle:
+        return hay
+    hay_l, needle_l = hay.lower(), needle.lower()
+    if len(hay_l) != len(hay) or len(needle_l) != len(needle):
+        # lower() changed a length (e.g. 'İ'), so offsets would not line up
+        return re.sub(re.escape(needle), lambda m: repl, hay, flags=re.IGNORECASE)
+    out, i = [], 0
+    while True:
+        j = hay_l.find(needle_l, i)
+        if j == -1:
+            break
+        out.append(hay[i:j])
+        out.append(repl)
+        i = j + len(needle_l)
+    out.append(hay[i:])
+    return "".join(out)
+
+class Renamer:
+    """One rename configuration; the replace pattern is compiled once up front."""
+
+    def __init__(self, mode, search=None, replace=None, prefix=None, suffix=None,
+                 case=None, use_regex=False):
+        self.mode = mode
+        self.search = search
+        self.replace = replace or ""
+        self.prefix = prefix
+        self.suffix = suffix
+        self.case = case
+        self.pat = None
+        if mode == "replace" and search and use_regex:
+            self.pat = re.compile(search)
+
+    @property
+    def is_noop(self):
+        """True when the chosen options cannot change any filename."""
+        return (
+            (self.mode == "replace" and not self.search)
+            or (self.mode == "prefix" and not self.prefix)
+            or (self.mode == "suffix" and not self.suffix)
+            or (self.mode == "case" and self.case not in ("upper", "lower", "title"))
+            or self.mode not in ("replace", "prefix", "suffix", "case")
+        )
+
+    def transform(self, old):
+        if self.mode == "replace":
+            if self.pat is None:
+                return ireplace(old, self.search, self.replace)
+            return self.pat.sub(self.replace, old)
+        if self.mode == "prefix":
+            return self.prefix + old
+        if self.mode == "suffix":
+            root, ext = os.path.splitext(old)
+            return root + self.suffix + ext
+        if self.mode == "case":
+            if self.case == "upper": return old.upper()
+            if self.case == "lower": return old.lower()
+            if self.case == "title": return old.title()
+        return old
+
+    def changes(self, files):
+        """Yield (file_id, old, new) for each file whose name would change."""
+        # A plain search can rule a name out with one substring test
+        needle = None
+        if self.mode == "replace" and self.pat is None:
+            needle = (self.search or "").lower()
+        for f in files:
+            old = f["name"]
+            if needle is not None and needle not in old.lower():
+                continue
+            new = self.transform(old)
+            if new != old:
+                yield f["id"], old, new
+
+    def rename_all(self, svc, files, dry_run, logpath):
+        """Preview or apply renames for `files`, logging to `logpath`. Returns the count."""
+        return apply_renames(svc, self.changes(files), logpath, dry_run)
+
+def find_collisions(files, proposed):
+    """
+    Proposed (file_id, old, new) renames whose new name is already taken, either
+    by a file that is not being renamed or by an earlier rename in the same run.
+    """
+    renaming = {fid for fid, _, _ in proposed}
+    taken = {f["name"] for f in files if f["id"] not in renaming}
+    collisions = []
+    for entry in proposed:
+        if entry[2] in taken:
+            collisions.append(entry)
+        else:
+            taken.add(entry[2])
+    return collisions
+
+def apply_renames(svc, changes, logpath, dry_run=False):
+    """
+    Print and log (file_id, old, new) renames, sending them to Drive in batches
+    unless `dry_run`. Works from an already-computed list, so a dry-run result
+    can be committed without transforming names again. Returns the count.
+    """
+    changed_count, pending = 0, {}
+    preview = []
+
+    def flush_preview():
+        sys.stdout.write("".join(preview))
+        sys.stdout.flush()
+        preview.clear()
+
+    # Log rows are written as renames succeed, so a crash keeps what got done
+    with open(logpath, "w", newline="", encoding="utf-8") as c:
+        w = csv.writer(c)
+        w.writerow(["file_id", "old_name", "new_name"])
+        for fid, old, new in changes:
+            preview.append(f"{old}  →  {new}\n")
+            if len(preview) >= PREVIEW_FLUSH_LINES:
+                flush_preview()
+            if dry_run:
+                w.writerow((fid, old, new))
+                changed_count += 1
+            else:
+                pending[fid] = (fid, old, new)
+                if len(pending) >= BATCH_SIZE:
+                    flush_preview()  # keep lines ahead of any failure messages
+                    changed_count += batch_rename(svc, pending, w.writerow)
+                    c.flush()
+                    pending = {}
+        flush_preview()
+        if pending:
+            changed_count += batch_rename(svc, pending, w.writerow)
+
+    if changed_count:
+        print(f"\n📝  Log saved to {logpath}")
+    else:
+        Path(logpath).unlink()
+        print("No changes made.")
+    return changed_count
@@ -6,28 +6,27 @@ def reset_tables():
     conn = sqlite3.connect(DB_FILE)
     cursor = conn.cursor()
 
-    # Turn off FK checks while dropping
-    cursor.execute("PRAGMA foreign_keys = OFF;")
+    # One script, one transaction for the drops and creates.
+    # PRAGMA foreign_keys is ignored inside a transaction, so it sits outside BEGIN/COMMIT.
+    cursor.executescript("""
+    -- Turn off FK checks while dropping
+    PRAGMA foreign_keys = OFF;
 
-    # Drop dependent tables first
-    cursor.execute("DROP TABLE IF EXISTS set_songs;")
-    cursor.execute("DROP TABLE IF EXISTS sets;")
+    BEGIN;
 
-    # Turn foreign keys back on
-    cursor.execute("PRAGMA foreign_keys = ON;")
+    -- Drop dependent tables first
+    DROP TABLE IF EXISTS set_songs;
+    DROP TABLE IF EXISTS sets;
 
-    # Recreate sets with UNIQUE set_number
-    cursor.execute("""
+    -- Recreate sets with UNIQUE set_number
     CREATE TABLE sets (
         set_id INTEGER PRIMARY KEY AUTOINCREMENT,
         set_number INTEGER NOT NULL UNIQUE,
         set_name TEXT,
         google_folder_id TEXT
     );
-    """)
 
-    # Recreate set_songs with FK constraints
-    cursor.execute("""
+    -- Recreate set_songs with FK constraints
     CREATE TABLE set_songs (
         id INTEGER PRIMARY KEY AUTOINCREMENT,
         set_id INTEGER NOT NULL,
@@ -38,9 +37,13 @@ def reset_tables():
         FOREIGN KEY (set_id) REFERENCES sets(set_id),
         FOREIGN KEY (song_id) REFERENCES songs(song_id)
     );
+
+    COMMIT;
+
+    -- Turn foreign keys back on
+    PRAGMA foreign_keys = ON;
     """)
 
-    conn.commit()
     conn.close()
     print("✅ Reset complete: 'sets' and 'set_songs' tables recreated")
 
@@ -1,4 +1,6 @@
 #!/usr/bin/env python3
+import atexit
+import functools
 import os
 import sqlite3
 import subprocess
@@ -12,41 +14,87 @@ DB_PATH = BASE_PATH / "script_menu.db"
 SUPPORTED_TYPES = {"python", "bash"}  # keep explicit; extend if you add more
 
 # ---------------- DB helpers ----------------
-def _table_columns(conn, table_name: str) -> set[str]:
-    cur = conn.cursor()
+_CONN = None
+
+def get_conn():
+    """One connection for the whole session, reused by every menu redraw and edit."""
+    global _CONN
+    if _CONN is None:
+        _CONN = sqlite3.connect(DB_PATH)
+        _CONN.row_factory = sqlite3.Row  # rows index by column name; dict(row) when a dict is needed
+        _CONN.executescript("""
+            PRAGMA journal_mode = WAL;      -- the launcher can read while we write
+            PRAGMA synchronous = NORMAL;
+            PRAGMA temp_store = MEMORY;
+            PRAGMA cache_size = -64000;     -- ~64 MB page cache
+        """)
+        atexit.register(_CONN.close)
+    return _CONN
+
+def _table_columns(conn, table_name: str) -> frozenset[str]:
+    return _cached_columns(str(DB_PATH), table_name)
+
+@functools.lru_cache(maxsize=16)
+def _cached_columns(db_path: str, table_name: str) -> frozenset[str]:
+    # Schema only changes through DDL, which this tool never runs; call
+    # _cached_columns.cache_clear() after any ALTER TABLE.
+    cur = get_conn().cursor()
     cur.execute(f"PRAGMA table_info({table_name})")
-    return {row[1] for row in cur.fetchall()}  # row[1] = column name
+    return frozenset(row[1] for row in cur.fetchall())  # row[1] = column name
+
+# Last load_menu_items() result and the (data_version, schema_version) it was read at.
+# data_version only moves for commits made by *other* connections, so our own
+# writes call _forget_menu_items() themselves.
+_items_cache = None
+_items_version = None
+
+@functools.lru_cache(maxsize=1)
+def _menu_select_sql() -> str:
+    """The menu SELECT for the current schema, built once (cleared with the column cache)."""
+    cols = _table_columns(get_conn(), "menu_items")
+    # Build a SELECT that only includes available columns
+    base_cols = ["id", "option_number", "label", "command", "type", "working_dir", "program_path"]
+    opt_cols  = [c for c in ("args", "base_path") if c in cols]
+    return f"""
+        SELECT {", ".join(base_cols + opt_cols)}
+        FROM menu_items
+        ORDER BY option_number
+    """
+
+def _db_version(conn) -> tuple[int, int]:
+    return (conn.execute("PRAGMA data_version").fetchone()[0],
+            conn.execute("PRAGMA schema_version").fetchone()[0])
+
+def _forget_menu_items():
+    global _items_cache
+    _items_cache = None
 
 def load_menu_items():
     """
     Returns a list of dicts. Handles both old schema and new (args/base_path) seamlessly.
     Required base columns: id, option_number, label, command, type, working_dir, program_path
     Optional columns: args, base_path
+    The list is reused until the database changes; treat it as read-only.
     """
-    conn = sqlite3.connect(DB_PATH)
-    cur = conn.cursor()
-
-    cols = _table_columns(conn, "menu_items")
-    # Build a SELECT that only includes available columns
-    base_cols = ["id", "option_number", "label", "command", "type", "working_dir", "program_path"]
-    opt_cols  = [c for c in ("args", "base_path") if c in cols]
-    select_cols = base_cols + opt_cols
-
-    cur.execute(f"""
-        SELECT {", ".join(select_cols)}
-        FROM menu_items
-        ORDER BY option_number
-    """)
-    rows = cur.fetchall()
-    conn.close()
+    global _items_cache, _items_version
+    conn = get_conn()
+    version = _db_version(conn)
+    if _items_cache is not None and version == _items_version:
+        return _items_cache
+    if _items_version is not None and version[1] != _items_version[1]:
+        # someone ran DDL on menu_items
+        _cached_columns.cache_clear()
+        _menu_select_sql.cache_clear()
+    rows = conn.execute(_menu_select_sql()).fetchall()
 
     items = []
     for row in rows:
-        rec = dict(zip(select_cols, row))
+        rec = dict(row)
         # Normalize missing optional fields
         rec.setdefault("args", "")
         rec.setdefault("base_path", "")
         items.append(rec)
+    _items_cache, _items_version = items, version
     return items
 
 # ---------------- Path + argv resolution ----------------
@@ -88,7 +136,18 @@ def _gather_args(item: dict) -> list[str]:
             out.extend(toks[1:])
     return out
 
+# Fields that decide the argv/cwd; a snapshot of them is the memo key
+_BUILD_FIELDS = ("type", "working_dir", "base_path", "program_path", "command", "args")
+
 def _build_command(item: dict) -> tuple[list[str], Path]:
+    argv, cwd = _build_command_cached(tuple(item.get(k) or "" for k in _BUILD_FIELDS))
+    return list(argv), Path(cwd)
+
+@functools.lru_cache(maxsize=64)
+def _build_command_cached(snapshot: tuple) -> tuple[tuple[str, ...], str]:
+    # Re-running an item skips shlex.split and path resolution; an edited item
+    # has a different snapshot, so it is never served a stale command.
+    item = dict(zip(_BUILD_FIELDS, snapshot))
     type_ = (item.get("type") or "").strip().lower()
     if type_ not in SUPPORTED_TYPES:
         raise ValueError(f"Unsupported type: {type_!r}. Supported: {', '.join(sorted(SUPPORTED_TYPES))}")
@@ -106,7 +165,7 @@ def _build_command(item: dict) -> tuple[list[str], Path]:
     else:
         argv = [str(script_path)] + args
 
-    return argv, base_dir
+    return tuple(argv), str(base_dir)
 
 # ---------------- Runner ----------------
 def run_menu_item(item: dict):
@@ -130,8 +189,30 @@ def run_menu_item(item: dict):
         print(f"❌ Failed to run: {e}")
 
 # ---------------- CRUD helpers ----------------
+_INSERT_SQL = """
+    INSERT INTO menu_items (option_number, label, command, type, working_dir, program_path, args, base_path)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+def insert_menu_items(conn, rows: list[tuple]):
+    """Insert any number of menu rows in one transaction (one commit, rolled back on error)."""
+    with conn:
+        conn.executemany(_INSERT_SQL, rows)
+    _forget_menu_items()
+
+def _retry_option(err, opt):
+    """
+    option_number is UNIQUE (the v3 editor indexes it), so a copy can clash with an
+    existing item. Ask for another number; None means give up.
+    """
+    if "option_number" not in str(err):
+        print(f"❌ {err}")
+        return None
+    print(f"❌ Option {opt} is already in use.")
+    return input("Enter a different option_number (blank to cancel): ").strip() or None
+
 def copy_menu_item():
-    conn = sqlite3.connect(DB_PATH)
+    conn = get_conn()
     cur = conn.cursor()
 
     from_id = input("Enter the ID or option_number of the item to copy: ").strip()
@@ -141,24 +222,26 @@ def copy_menu_item():
         print("❌ No such item.")
         return
 
-    columns = [desc[0] for desc in cur.description]
-    rec = dict(zip(columns, row))
+    rec = dict(row)
 
     new_opt = input(f"New option_number (was {rec['option_number']}): ").strip() or rec['option_number']
     new_label = input(f"New label (was {rec['label']}): ").strip() or rec['label']
     new_args = input(f"New args (was {rec.get('args','')}): ").strip() or rec.get('args','')
 
-    cur.execute("""
-        INSERT INTO menu_items (option_number, label, command, type, working_dir, program_path, args, base_path)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-    """, (new_opt, new_label, rec['command'], rec['type'], rec['working_dir'],
-          rec['program_path'], new_args, rec.get('base_path','')))
-    conn.commit()
-    conn.close()
+    while True:
+        try:
+            insert_menu_items(conn, [(new_opt, new_label, rec['command'], rec['type'], rec['working_dir'],
+                                      rec['program_path'], new_args, rec.get('base_path',''))])
+            break
+        except sqlite3.IntegrityError as e:
+            new_opt = _retry_option(e, new_opt)
+            if new_opt is None:
+                print("Option not copied.")
+                return
     print("✅ Option copied and added.")
 
 def edit_menu_item_args():
-    conn = sqlite3.connect(DB_PATH)
+    conn = get_conn()
     cur = conn.cursor()
 
     from_id = input("Enter the ID or option_number to edit args: ").strip()
@@ -168,15 +251,14 @@ def edit_menu_item_args():
         print("❌ No such item.")
         return
 
-    columns = [desc[0] for desc in cur.description]
-    rec = dict(zip(columns, row))
+    rec = dict(row)
 
     print(f"Current args: {rec.get('args','')}")
     new_args = input("New args (leave blank to keep current): ").strip() or rec.get('args','')
 
     cur.execute("UPDATE menu_items SET args=? WHERE id=?", (new_args, rec['id']))
     conn.commit()
-    conn.close()
+    _forget_menu_items()
     print("✅ Args updated.")
 
 # ---------------- UI ----------------
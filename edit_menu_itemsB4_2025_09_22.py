@@ -1,58 +1,108 @@
 #!/usr/bin/env python3
+import atexit
 import sqlite3
+import sys
 from pathlib import Path
 
 BASE_PATH = Path("/home/keith/PythonProjects/projects/Mixed_Nuts")
 DB_PATH = BASE_PATH / "script_menu.db"
 
 # ---------------- DB helpers ----------------
+_CONN = None
+
+def get_conn():
+    """One connection for the whole session, shared by every list and edit."""
+    global _CONN
+    if _CONN is None:
+        _CONN = sqlite3.connect(DB_PATH)
+        _CONN.row_factory = sqlite3.Row  # rows index by column name, no per-row dict needed
+        _CONN.execute("PRAGMA journal_mode=WAL")  # the launcher can read while we write
+        _CONN.execute("PRAGMA synchronous=NORMAL")
+        atexit.register(_CONN.close)
+    return _CONN
+
+_COLS_CACHE: list[str] | None = None  # menu_items columns, read once per run
+
+def _read_columns(cur):
+    global _COLS_CACHE
+    if _COLS_CACHE is None:
+        cur.execute("PRAGMA table_info(menu_items)")
+        _COLS_CACHE = [row[1] for row in cur.fetchall()]  # row[1] = column name
+    return _COLS_CACHE
+
 def get_columns():
-    conn = sqlite3.connect(DB_PATH)
-    cur = conn.cursor()
-    cur.execute("PRAGMA table_info(menu_items)")
-    cols = [row[1] for row in cur.fetchall()]  # row[1] = column name
-    conn.close()
-    return cols
+    return _read_columns(get_conn().cursor())
+
+def invalidate_columns():
+    """Forget the cached column list (call after altering menu_items)."""
+    global _COLS_CACHE
+    _COLS_CACHE = None
 
 def load_menu_items():
-    conn = sqlite3.connect(DB_PATH)
+    conn = get_conn()
     cur = conn.cursor()
-    cols = get_columns()
-    cur.execute(f"SELECT {', '.join(cols)} FROM menu_items ORDER BY option_number")
-    rows = cur.fetchall()
-    conn.close()
+    cur.execute("BEGIN")  # one read transaction: the PRAGMA and SELECT see the same snapshot
+    try:
+        cols = _read_columns(cur)
+        cur.execute(f"SELECT {', '.join(cols)} FROM menu_items ORDER BY option_number")
+        rows = cur.fetchall()
+    finally:
+        conn.commit()
     return cols, rows
 
+_ITEM_FIELDS = ("option_number", "label", "command", "type", "base_path", "working_dir", "program_path")
+_ITEM_TEMPLATE = (
+    "Option:    {option_number}\n"
+    "Label:     {label}\n"
+    "Command:   {command}\n"
+    "Type:      {type}\n"
+    "Base Path: {base_path}\n"
+    "Working Dir:  {working_dir}\n"
+    "Program Path: {program_path}\n"
+    "Args:\n"
+)
+_RULE = "=" * 60 + "\n"
+
 def list_items():
     cols, rows = load_menu_items()
     if not rows:
         print("\n(No items found)")
         return
 
-    print("\nCurrent menu items:")
-    print("=" * 60)
+    # Older databases may lack some columns (e.g. args, base_path); show those blank
+    template = _ITEM_TEMPLATE
+    for name in _ITEM_FIELDS:
+        if name not in cols:
+            template = template.replace("{%s}" % name, "")
+    has_args = "args" in cols
 
+    # Build the whole listing, then write it once
+    out = ["\nCurrent menu items:\n", _RULE]
     for row in rows:
-        rec = dict(zip(cols, row))
-        print(f"Option:    {rec.get('option_number','')}")
-        print(f"Label:     {rec.get('label','')}")
-        print(f"Command:   {rec.get('command','')}")
-        print(f"Type:      {rec.get('type','')}")
-        print(f"Base Path: {rec.get('base_path','')}")
-        print(f"Working Dir:  {rec.get('working_dir','')}")
-        print(f"Program Path: {rec.get('program_path','')}")
-        print("Args:")
-        args_text = rec.get('args', '') or ""
+        out.append(template.format_map(row))
+        args_text = (row["args"] if has_args else "") or ""
         if args_text.strip():
-            for line in args_text.splitlines():
-                print(f"   {line}")
+            out.extend(f"   {line}\n" for line in args_text.splitlines())
         else:
-            print("   (none)")
-        print("=" * 60)
-        
+            out.append("   (none)\n")
+        out.append(_RULE)
+    sys.stdout.write("".join(out))
+
+
 # ---------------- CRUD helpers ----------------
+def _retry_option(err, opt):
+    """
+    option_number is UNIQUE (the v3 editor indexes it), so a write can clash with an
+    existing item. Ask for another number; None means give up.
+    """
+    if "option_number" not in str(err):
+        print(f"❌ {err}")
+        return None
+    print(f"❌ Option {opt} is already in use.")
+    return input("Enter a different option_number (blank to cancel): ").strip() or None
+
 def add_item():
-    conn = sqlite3.connect(DB_PATH)
+    conn = get_conn()
     cur = conn.cursor()
 
     option_number = input("Option number: ").strip()
@@ -64,16 +114,23 @@ def add_item():
     args = input("Args (optional): ").strip()
     base_path = input("Base path (optional): ").strip()
 
-    cur.execute("""
-        INSERT INTO menu_items (option_number, label, command, type, working_dir, program_path, args, base_path)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-    """, (option_number, label, command, type_, working_dir, program_path, args, base_path))
-    conn.commit()
-    conn.close()
+    while True:
+        try:
+            with conn:  # commits, or rolls back the failed insert
+                cur.execute("""
+                    INSERT INTO menu_items (option_number, label, command, type, working_dir, program_path, args, base_path)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """, (option_number, label, command, type_, working_dir, program_path, args, base_path))
+            break
+        except sqlite3.IntegrityError as e:
+            option_number = _retry_option(e, option_number)
+            if option_number is None:
+                print("Item not added.")
+                return
     print("✅ Item added.")
 
 def update_item():
-    conn = sqlite3.connect(DB_PATH)
+    conn = get_conn()
     cur = conn.cursor()
 
     optnum = input("Enter the option_number of the item to update: ").strip()
@@ -87,13 +144,20 @@ def update_item():
         return
     id_ = row[0]
 
-    cur.execute(f"UPDATE menu_items SET {field}=? WHERE id=?", (value, id_))
-    conn.commit()
-    conn.close()
+    while True:
+        try:
+            with conn:
+                cur.execute(f"UPDATE menu_items SET {field}=? WHERE id=?", (value, id_))
+            break
+        except sqlite3.IntegrityError as e:
+            value = _retry_option(e, value)
+            if value is None:
+                print("Item not updated.")
+                return
     print("✅ Item updated.")
 
 def delete_item():
-    conn = sqlite3.connect(DB_PATH)
+    conn = get_conn()
     cur = conn.cursor()
 
     optnum = input("Enter the option_number of the item to delete: ").strip()
@@ -106,11 +170,10 @@ def delete_item():
 
     cur.execute("DELETE FROM menu_items WHERE id=?", (id_,))
     conn.commit()
-    conn.close()
     print("✅ Item deleted.")
 
 def copy_item():
-    conn = sqlite3.connect(DB_PATH)
+    conn = get_conn()
     cur = conn.cursor()
 
     optnum = input("Enter the option_number of the item to copy: ").strip()
@@ -124,12 +187,19 @@ def copy_item():
     new_label = input(f"New label (was {row[1]}): ").strip() or row[1]
     new_args = input(f"New args (was {row[6]}): ").strip() or row[6]
 
-    cur.execute("""
-        INSERT INTO menu_items (option_number, label, command, type, working_dir, program_path, args, base_path)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-    """, (new_opt, new_label, row[2], row[3], row[4], row[5], new_args, row[7]))
-    conn.commit()
-    conn.close()
+    while True:
+        try:
+            with conn:
+                cur.execute("""
+                    INSERT INTO menu_items (option_number, label, command, type, working_dir, program_path, args, base_path)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """, (new_opt, new_label, row[2], row[3], row[4], row[5], new_args, row[7]))
+            break
+        except sqlite3.IntegrityError as e:
+            new_opt = _retry_option(e, new_opt)
+            if new_opt is None:
+                print("Item not copied.")
+                return
     print("✅ Item copied.")
 
 # ---------------- UI ----------------
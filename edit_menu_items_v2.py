@@ -9,6 +9,8 @@ Enhancements:
   • Fully backward compatible with menu_launcherV2.py
 """
 
+import bisect
+import functools
 import sqlite3
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
@@ -43,8 +45,8 @@ def get_table_columns(conn, table: str) -> list[str]:
     cur.execute(f"PRAGMA table_info({table})")
     return [r[1] for r in cur.fetchall()]
 
-def load_by_option_number(conn, opt_num: int) -> dict | None:
-    cols = get_table_columns(conn, "menu_items")
+def load_by_option_number(conn, opt_num: int, cols: list[str]) -> dict | None:
+    # cols is the editor's self.cols, read once at startup; the schema doesn't change mid-session
     cur = conn.cursor()
     cur.execute(f"SELECT {', '.join(cols)} FROM menu_items WHERE option_number = ?", (opt_num,))
     row = cur.fetchone()
@@ -60,12 +62,10 @@ def load_next_prev_option(conn, current_opt: int | None, direction: int) -> int
         return None
     if current_opt is None:
         return options[0]
-    try:
-        idx = options.index(current_opt)
-    except ValueError:
-        options.append(current_opt)
-        options.sort()
-        idx = options.index(current_opt)
+    # options is already sorted by the query, so binary-search it
+    idx = bisect.bisect_left(options, current_opt)
+    if idx == len(options) or options[idx] != current_opt:
+        options.insert(idx, current_opt)  # not saved yet: step from where it would sit
     idx = max(0, min(len(options) - 1, idx + direction))
     return options[idx]
 
@@ -75,10 +75,20 @@ def option_exists(conn, opt_num: int) -> tuple[bool, int | None]:
     row = cur.fetchone()
     return (row is not None, (row[0] if row else None))
 
+# The form always yields the same keys, so each statement is built once per column set
+@functools.lru_cache(maxsize=8)
+def _insert_sql(cols: tuple[str, ...]) -> str:
+    return f"INSERT INTO menu_items ({', '.join(cols)}) VALUES ({', '.join(['?']*len(cols))})"
+
+@functools.lru_cache(maxsize=8)
+def _update_sql(cols: tuple[str, ...]) -> str:
+    sets = ", ".join([f"{c} = ?" for c in cols])
+    return f"UPDATE menu_items SET {sets} WHERE id = ?"
+
 def insert_item(conn, record: dict, available_cols: list[str]) -> int:
-    cols = [c for c in record.keys() if c in available_cols and c != "id"]
+    cols = tuple(c for c in record.keys() if c in available_cols and c != "id")
     vals = [record[c] for c in cols]
-    sql = f"INSERT INTO menu_items ({', '.join(cols)}) VALUES ({', '.join(['?']*len(cols))})"
+    sql = _insert_sql(cols)
     cur = conn.cursor()
     cur.execute(sql, vals)
     conn.commit()
@@ -87,10 +97,9 @@ def insert_item(conn, record: dict, available_cols: list[str]) -> int:
 def update_item(conn, record: dict, available_cols: list[str]) -> None:
     if "id" not in record or record["id"] is None:
         raise ValueError("Cannot update without a valid 'id'.")
-    cols = [c for c in record.keys() if c in available_cols and c not in ("id",)]
-    sets = ", ".join([f"{c} = ?" for c in cols])
+    cols = tuple(c for c in record.keys() if c in available_cols and c not in ("id",))
     vals = [record[c] for c in cols] + [record["id"]]
-    sql = f"UPDATE menu_items SET {sets} WHERE id = ?"
+    sql = _update_sql(cols)
     cur = conn.cursor()
     cur.execute(sql, vals)
     conn.commit()
@@ -114,6 +123,7 @@ class MenuItemEditor(tk.Tk):
             self.geometry("2000x1500")  # fallback if zoomed not supported
 
         # DB & schema
+        self._preview_pending = False
         self.conn = db_connect()
         self.cols = get_table_columns(self.conn, "menu_items")
         self.has_args = "args" in self.cols
@@ -261,7 +271,7 @@ class MenuItemEditor(tk.Tk):
             self.var_option, self.var_label, self.var_command,
             self.var_program_path, self.var_type
         ):
-            var.trace_add("write", lambda *_: self._update_preview())
+            var.trace_add("write", self._request_preview)
 
     # ---------------- File browsers ----------------
     def _browse_dir_working(self):
@@ -295,7 +305,7 @@ class MenuItemEditor(tk.Tk):
             self._load_option(opt)
 
     def _load_option(self, opt_num: int):
-        rec = load_by_option_number(self.conn, opt_num)
+        rec = load_by_option_number(self.conn, opt_num, self.cols)
         if not rec:
             self._log(f"Option {opt_num} not found.")
             if messagebox.askyesno("Not found", f"Option {opt_num} doesn't exist. Create new?"):
@@ -424,6 +434,16 @@ class MenuItemEditor(tk.Tk):
             self._log("Enter a numeric option number to reload.")
 
     # ----- Preview & log -----
+    def _request_preview(self, *_):
+        # Coalesce: a burst of keystrokes or var.set() calls redraws the preview once, when Tk is idle
+        if not self._preview_pending:
+            self._preview_pending = True
+            self.after_idle(self._do_preview)
+
+    def _do_preview(self):
+        self._preview_pending = False
+        self._update_preview()
+
     def _update_preview(self):
         opt = self.var_option.get().strip() or "?"
         label = self.var_label.get().strip() or "(label)"
@@ -10,6 +10,7 @@ Enhancements:
   • Fully compatible with menu_launcher_v3.py
 """
 
+import functools
 import sqlite3
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
@@ -21,85 +22,141 @@ import os
 BASE_PATH = Path("/home/keith/PythonProjects/projects/Mixed_Nuts")
 DB_PATH = BASE_PATH / "script_menu.db"
 STATUS_FILE = BASE_PATH / "menu_status.txt"
+BASE_STR = str(BASE_PATH)  # default start folder for the Browse dialogs
 SUPPORTED_TYPES = ("python", "bash")
+FORM_DEFAULTS = {"type": SUPPORTED_TYPES[0], "keep_open": "*Auto"}  # shown for NULL/empty columns; others show ""
+LOG_MAX_LINES = 200  # the on-screen log keeps only this many recent lines
+
+# Fixed SQL text, so sqlite3's statement cache hands back the prepared statement on reuse
+SQL_OPTION_EXISTS = "SELECT id FROM menu_items WHERE option_number = ?"
+SQL_DELETE = "DELETE FROM menu_items WHERE id = ?"
 
 # ---------------- utilities ----------------
-def append_status(msg: str):
-    """Append a timestamped line to the shared status file."""
+def _open_append(buffering: int = -1):
+    # Write-only O_APPEND, never "a+": a readable append handle makes the OS seek
+    # before every write, which is noticeably slow on NFS-mounted homes. O_APPEND
+    # also keeps lines from the launcher and the editor from overwriting each other.
+    fd = os.open(STATUS_FILE, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    return os.fdopen(fd, "a", buffering=buffering, encoding="utf-8")
+
+def open_status_file():
+    """Buffered append handle on the status file, kept for the editor's lifetime (None on failure)."""
     try:
         BASE_PATH.mkdir(parents=True, exist_ok=True)
-        with open(STATUS_FILE, "a", encoding="utf-8") as f:
-            ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        return _open_append(buffering=64 * 1024)
+    except Exception:
+        return None
+
+def append_status(msg: str, fh=None):
+    """Append a timestamped line to the shared status file (via `fh` when one is open)."""
+    try:
+        ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        if fh is not None:
+            fh.write(f"{ts}  {msg}\n")  # flushed when the handle is closed
+            return
+        BASE_PATH.mkdir(parents=True, exist_ok=True)
+        with _open_append() as f:
             f.write(f"{ts}  {msg}\n")
     except Exception:
         pass  # Never crash on status write failure
 
 
+@functools.lru_cache(maxsize=32)
+def _resolve_initial_dir(start: str, base: str) -> str:
+    """Folder to open a file dialog in: `start` itself if it is a directory, else its parent."""
+    # Cached so repeated Browse clicks don't stat the same (possibly network) path again
+    return start if os.path.isdir(start) else os.path.dirname(start) or base
+
+
 # ---------------- DB helpers ----------------
 def db_connect():
-    return sqlite3.connect(DB_PATH)
+    conn = sqlite3.connect(DB_PATH, cached_statements=256)
+    conn.row_factory = sqlite3.Row  # rows index by column name; dict(row) when a dict is needed
+    conn.executescript("""
+        PRAGMA journal_mode = WAL;      -- saves don't block the launcher, and commit without a full fsync
+        PRAGMA synchronous = NORMAL;
+        PRAGMA temp_store = MEMORY;
+        PRAGMA mmap_size = 268435456;   -- read pages through a 256 MB map
+        PRAGMA cache_size = -20000;     -- ~20 MB page cache
+    """)
+    return conn
+
+def ensure_indexes(conn) -> bool:
+    """
+    Index option_number so Prev/Next and lookups are B-tree seeks, not table scans.
+    The index is UNIQUE, so a save can't leave two rows with the same option number.
+    Returns True when that UNIQUE index is in place.
+    """
+    try:
+        with conn:
+            conn.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_menu_items_option_number "
+                         "ON menu_items(option_number)")
+            conn.execute("DROP INDEX IF EXISTS idx_menu_opt")  # older non-unique index, now redundant
+        return True
+    except sqlite3.IntegrityError:
+        # Duplicate option numbers already in the table: keep a plain index until they're fixed
+        try:
+            with conn:
+                conn.execute("CREATE INDEX IF NOT EXISTS idx_menu_opt ON menu_items(option_number)")
+        except sqlite3.Error:
+            pass
+    except sqlite3.Error:
+        pass  # e.g. read-only DB; queries still work, just without the index
+    return False
 
 def get_table_columns(conn, table: str) -> list[str]:
     cur = conn.cursor()
     cur.execute(f"PRAGMA table_info({table})")
     return [r[1] for r in cur.fetchall()]
 
-def load_by_option_number(conn, opt_num: int) -> dict | None:
-    cols = get_table_columns(conn, "menu_items")
-    cur = conn.cursor()
-    cur.execute(f"SELECT {', '.join(cols)} FROM menu_items WHERE option_number = ?", (opt_num,))
-    row = cur.fetchone()
-    if not row:
-        return None
-    return dict(zip(cols, row))
+def build_statements(cols: list[str], write_cols: list[str]) -> dict[str, str]:
+    """SQL for the session's schema, built once; the column lists never change while the editor runs."""
+    return {
+        "select": f"SELECT {', '.join(cols)} FROM menu_items WHERE option_number = ?",
+        "insert": f"INSERT INTO menu_items ({', '.join(write_cols)}) VALUES ({', '.join(['?'] * len(write_cols))})",
+        "update": f"UPDATE menu_items SET {', '.join(f'{c} = ?' for c in write_cols)} WHERE id = ?",
+    }
+
+def load_by_option_number(conn, opt_num: int, select_sql: str) -> dict | None:
+    row = conn.execute(select_sql, (opt_num,)).fetchone()
+    return dict(row) if row else None
 
 def load_next_prev_option(conn, current_opt: int | None, direction: int) -> int | None:
+    """Neighbouring option number, clamped at the first/last one (None if the table is empty)."""
     cur = conn.cursor()
-    cur.execute("SELECT option_number FROM menu_items ORDER BY option_number")
-    options = [r[0] for r in cur.fetchall()]
-    if not options:
-        return None
     if current_opt is None:
-        return options[0]
-    try:
-        idx = options.index(current_opt)
-    except ValueError:
-        options.append(current_opt)
-        options.sort()
-        idx = options.index(current_opt)
-    idx = max(0, min(len(options) - 1, idx + direction))
-    return options[idx]
+        cur.execute("SELECT MIN(option_number) FROM menu_items")
+        return cur.fetchone()[0]
+    if direction > 0:
+        cur.execute("SELECT option_number FROM menu_items WHERE option_number > ? "
+                    "ORDER BY option_number ASC LIMIT 1", (current_opt,))
+    else:
+        cur.execute("SELECT option_number FROM menu_items WHERE option_number < ? "
+                    "ORDER BY option_number DESC LIMIT 1", (current_opt,))
+    row = cur.fetchone()
+    if row:
+        return row[0]
+    # Already at (or past) the end in that direction: stay on the last/first one
+    cur.execute(f"SELECT {'MAX' if direction > 0 else 'MIN'}(option_number) FROM menu_items")
+    return cur.fetchone()[0]
 
 def option_exists(conn, opt_num: int) -> tuple[bool, int | None]:
-    cur = conn.cursor()
-    cur.execute("SELECT id FROM menu_items WHERE option_number = ?", (opt_num,))
-    row = cur.fetchone()
+    row = conn.execute(SQL_OPTION_EXISTS, (opt_num,)).fetchone()
     return (row is not None, (row[0] if row else None))
 
-def insert_item(conn, record: dict, available_cols: list[str]) -> int:
-    cols = [c for c in record.keys() if c in available_cols and c != "id"]
-    vals = [record[c] for c in cols]
-    sql = f"INSERT INTO menu_items ({', '.join(cols)}) VALUES ({', '.join(['?']*len(cols))})"
-    cur = conn.cursor()
-    cur.execute(sql, vals)
-    conn.commit()
+# The write helpers don't commit; callers wrap each logical change in `with conn:`,
+# which commits once on success and rolls back on error.
+def insert_item(conn, record: dict, write_cols: list[str], insert_sql: str) -> int:
+    cur = conn.execute(insert_sql, [record.get(c) for c in write_cols])
     return cur.lastrowid
 
-def update_item(conn, record: dict, available_cols: list[str]) -> None:
+def update_item(conn, record: dict, write_cols: list[str], update_sql: str) -> None:
     if "id" not in record or record["id"] is None:
         raise ValueError("Cannot update without a valid 'id'.")
-    cols = [c for c in record.keys() if c in available_cols and c not in ("id",)]
-    sets = ", ".join([f"{c} = ?" for c in cols])
-    vals = [record[c] for c in cols] + [record["id"]]
-    sql = f"UPDATE menu_items SET {sets} WHERE id = ?"
-    cur = conn.cursor()
-    cur.execute(sql, vals)
-    conn.commit()
+    conn.execute(update_sql, [record.get(c) for c in write_cols] + [record["id"]])
 
 def delete_item(conn, rec_id: int):
-    cur = conn.cursor()
-    cur.execute("DELETE FROM menu_items WHERE id = ?", (rec_id,))
-    conn.commit()
+    conn.execute(SQL_DELETE, (rec_id,))
 
 
 # ---------------- Tk app ----------------
@@ -115,6 +172,8 @@ class MenuItemEditor(tk.Tk):
 
         # DB & schema
         self.conn = db_connect()
+        self.unique_options = ensure_indexes(self.conn)
+        self._status_fh = open_status_file()
         self.cols = get_table_columns(self.conn, "menu_items")
         self.has_args = "args" in self.cols
         self.has_base_path = "base_path" in self.cols
@@ -124,8 +183,20 @@ class MenuItemEditor(tk.Tk):
         # Current record cache
         self.current_record: dict | None = None
 
+        # Log lines waiting for the next flush (see _log)
+        self._log_buf: list[str] = []
+        self._log_pending = False
+
+        # Inputs behind the preview label as last drawn (see _update_preview)
+        self._last_preview_key: tuple | None = None
+        self._preview_after: str | None = None
+
         # Build UI
         self._build_ui()
+
+        # Columns the form writes, and the SQL for them, fixed for the session
+        self.write_cols = [c for c in self._collect_form() if c in self.cols and c != "id"]
+        self.sql = build_statements(self.cols, self.write_cols)
         self._log("Editor ready. Enter an option number and click Load.")
 
         # Keyboard shortcuts
@@ -276,22 +347,22 @@ class MenuItemEditor(tk.Tk):
             self.var_option, self.var_label, self.var_command,
             self.var_program_path, self.var_type, self.var_keep_open
         ):
-            var.trace_add("write", lambda *_: self._update_preview())
+            var.trace_add("write", self._on_var_write)
 
     # ---------------- File browsers ----------------
     def _browse_dir_working(self):
-        start = self.var_working_dir.get() or str(BASE_PATH)
+        start = self.var_working_dir.get() or BASE_STR
         d = filedialog.askdirectory(initialdir=start, title="Select Working Directory")
         if d: self.var_working_dir.set(d)
 
     def _browse_dir_base(self):
-        start = self.var_base_path.get() or str(BASE_PATH)
+        start = self.var_base_path.get() or BASE_STR
         d = filedialog.askdirectory(initialdir=start, title="Select Base Path")
         if d: self.var_base_path.set(d)
 
     def _browse_file_program(self):
-        start = self.var_program_path.get() or str(BASE_PATH)
-        initialdir = start if os.path.isdir(start) else os.path.dirname(start) or str(BASE_PATH)
+        start = self.var_program_path.get() or BASE_STR
+        initialdir = _resolve_initial_dir(start, BASE_STR)
         f = filedialog.askopenfilename(initialdir=initialdir, title="Select Program Path")
         if f: self.var_program_path.set(f)
 
@@ -310,7 +381,7 @@ class MenuItemEditor(tk.Tk):
             self._load_option(opt)
 
     def _load_option(self, opt_num: int):
-        rec = load_by_option_number(self.conn, opt_num)
+        rec = load_by_option_number(self.conn, opt_num, self.sql["select"])
         if not rec:
             self._log(f"Option {opt_num} not found.")
             if messagebox.askyesno("Not found", f"Option {opt_num} doesn't exist. Create new?"):
@@ -327,7 +398,7 @@ class MenuItemEditor(tk.Tk):
         self.var_id.set(str(rec.get("id") or ""))
         self.var_option.set(str(rec.get("option_number") or ""))
         self.var_label.set(rec.get("label") or "")
-        self.var_type.set(rec.get("type") or SUPPORTED_TYPES[0])
+        self.var_type.set(rec.get("type") or FORM_DEFAULTS["type"])
         self.var_command.set(rec.get("command") or "")
         if self.has_args and self.txt_args:
             self.txt_args.delete("1.0", "end")
@@ -337,7 +408,7 @@ class MenuItemEditor(tk.Tk):
             self.var_base_path.set(rec.get("base_path") or "")
         self.var_program_path.set(rec.get("program_path") or "")
         if self.has_keep_open:
-            self.var_keep_open.set(rec.get("keep_open") or "*Auto")
+            self.var_keep_open.set(rec.get("keep_open") or FORM_DEFAULTS["keep_open"])
         if self.has_description and self.txt_description:
             self.txt_description.delete("1.0", "end")
             self.txt_description.insert("1.0", rec.get("description") or "")
@@ -380,32 +451,76 @@ class MenuItemEditor(tk.Tk):
 
     def save(self):
         rec = self._collect_form()
+        if self._unchanged(rec):
+            self._log("No changes to save.")
+            return
         if not self._validate(rec):
             return
-        exists, rec_id = option_exists(self.conn, rec["option_number"])
+        # With the UNIQUE index a new row is simply inserted and a clash comes back as
+        # IntegrityError; without it, look the option up first. Either way the question
+        # is asked outside any transaction.
+        if not rec["id"] and not self.unique_options and not self._claim_existing(rec):
+            return
         try:
-            if rec["id"]:
-                update_item(self.conn, rec, self.cols)
-                self._log(f"Updated id={rec['id']} (option {rec['option_number']}).")
-            else:
-                if exists:
-                    if not messagebox.askyesno(
-                        "Overwrite?",
-                        f"Option {rec['option_number']} already exists.\nUpdate that row instead?"
-                    ):
-                        return
-                    rec["id"] = rec_id
-                    update_item(self.conn, rec, self.cols)
-                    self._log(f"Updated existing option {rec['option_number']} (id={rec_id}).")
-                else:
-                    new_id = insert_item(self.conn, rec, self.cols)
-                    self.var_id.set(str(new_id))
-                    self._log(f"Inserted new item id={new_id} (option {rec['option_number']}).")
+            msg = self._write(rec)
+        except sqlite3.IntegrityError as e:
+            if rec["id"] or not self.unique_options:
+                messagebox.showerror("DB Error", str(e))
+                return
+            if not option_exists(self.conn, rec["option_number"])[0]:
+                messagebox.showerror("DB Error", str(e))  # some other constraint
+                return
+            if not self._claim_existing(rec):
+                return
+            try:
+                msg = self._write(rec)
+            except Exception as e:
+                messagebox.showerror("DB Error", str(e))
+                return
         except Exception as e:
             messagebox.showerror("DB Error", str(e))
             return
+        self.current_record = rec
+        self._log(msg)
         self._update_preview()
 
+    def _unchanged(self, rec: dict) -> bool:
+        """True when rec is the loaded record as-is (e.g. a second Save), so there's nothing to write."""
+        cur = self.current_record
+        if not rec["id"] or not cur or cur.get("id") != rec["id"]:
+            return False
+        return all(self._as_shown(k, rec[k]) == self._as_shown(k, cur.get(k)) for k in rec)
+
+    @staticmethod
+    def _as_shown(key: str, value):
+        """A value as the form would show it: NULL/empty becomes the field's default, text is stripped."""
+        value = value or FORM_DEFAULTS.get(key, "")
+        return value.strip() if isinstance(value, str) else value
+
+    def _claim_existing(self, rec: dict) -> bool:
+        """If rec's option number is taken, offer to update that row; False means cancel."""
+        exists, rec_id = option_exists(self.conn, rec["option_number"])
+        if not exists:
+            return True
+        if not messagebox.askyesno(
+            "Overwrite?",
+            f"Option {rec['option_number']} already exists.\nUpdate that row instead?"
+        ):
+            return False
+        rec["id"] = rec_id
+        return True
+
+    def _write(self, rec: dict) -> str:
+        """Insert or update rec in one transaction (rolled back on error); returns the log line."""
+        with self.conn:
+            if rec["id"]:
+                update_item(self.conn, rec, self.write_cols, self.sql["update"])
+                return f"Updated id={rec['id']} (option {rec['option_number']})."
+            new_id = insert_item(self.conn, rec, self.write_cols, self.sql["insert"])
+        rec["id"] = new_id
+        self.var_id.set(str(new_id))
+        return f"Inserted new item id={new_id} (option {rec['option_number']})."
+
     def delete(self):
         rec_id = int(self.var_id.get()) if self.var_id.get().isdigit() else None
         if not rec_id:
@@ -414,7 +529,8 @@ class MenuItemEditor(tk.Tk):
         if not messagebox.askyesno("Confirm Delete", f"Delete item id={rec_id}? This cannot be undone."):
             return
         try:
-            delete_item(self.conn, rec_id)
+            with self.conn:
+                delete_item(self.conn, rec_id)
         except Exception as e:
             messagebox.showerror("DB Error", str(e))
             return
@@ -448,11 +564,26 @@ class MenuItemEditor(tk.Tk):
             self._log("Enter a numeric option number to reload.")
 
     # ----- Preview & log -----
+    def _on_var_write(self, *_):
+        """trace_add callback shared by every previewed variable."""
+        self._schedule_preview()
+
+    def _schedule_preview(self):
+        # Debounce: a burst of keystrokes or var.set() calls redraws the preview once
+        if self._preview_after is not None:
+            self.after_cancel(self._preview_after)
+        self._preview_after = self.after(20, self._update_preview)
+
     def _update_preview(self):
+        self._preview_after = None
         opt = self.var_option.get().strip() or "?"
         label = self.var_label.get().strip() or "(label)"
         cmd = self.var_command.get().strip() or self.var_program_path.get().strip()
         keep = self.var_keep_open.get() if self.has_keep_open else "*Auto"
+        key = (opt, label, cmd, keep)
+        if key == self._last_preview_key:
+            return  # e.g. a keystroke in a field the preview doesn't show
+        self._last_preview_key = key
         preview = f"{opt}. {label}"
         if cmd:
             preview += f" ({cmd})"
@@ -460,10 +591,23 @@ class MenuItemEditor(tk.Tk):
         self.lbl_preview.configure(text=preview)
 
     def _log(self, text: str):
+        # Coalesce bursts of messages into one widget update every 50 ms
+        self._log_buf.append(text + "\n")
+        if not self._log_pending:
+            self._log_pending = True
+            self.after(50, self._flush_log)
+
+    def _flush_log(self):
+        self._log_pending = False
+        if not self._log_buf:
+            return
         self.txt_log.configure(state="normal")
-        self.txt_log.insert("end", text + "\n")
+        self.txt_log.insert("end", "".join(self._log_buf))
+        # Trim from the top so a long session doesn't keep growing the Text widget
+        self.txt_log.delete("1.0", f"end - {LOG_MAX_LINES + 1} lines")
         self.txt_log.see("end")
         self.txt_log.configure(state="disabled")
+        self._log_buf.clear()
 
     # ----- Close hook -----
     def on_close(self):
@@ -474,8 +618,13 @@ class MenuItemEditor(tk.Tk):
                 msg = f"Editor closed; last item on screen was option {opt} - {label}"
             else:
                 msg = "Editor closed."
-            append_status(msg)
+            append_status(msg, self._status_fh)
         finally:
+            try:
+                if self._status_fh:
+                    self._status_fh.close()  # flushes buffered status lines
+            except Exception:
+                pass
             try:
                 self.conn.close()
             except Exception:
@@ -12,10 +12,20 @@ DB_PATH = BASE_PATH / "script_menu.db"
 SUPPORTED_TYPES = {"python", "bash"}  # keep explicit; extend if you add more
 
 # ---------------- DB helpers ----------------
+# table -> (schema_version it was read at, column names). The editor can add
+# columns while the launcher is running, so the cache is keyed on the version.
+_COLS_CACHE: dict[str, tuple[int, set[str]]] = {}
+
 def _table_columns(conn, table_name: str) -> set[str]:
     cur = conn.cursor()
+    version = cur.execute("PRAGMA schema_version").fetchone()[0]  # one integer from the header
+    cached = _COLS_CACHE.get(table_name)
+    if cached and cached[0] == version:
+        return cached[1]
     cur.execute(f"PRAGMA table_info({table_name})")
-    return {row[1] for row in cur.fetchall()}  # row[1] = column name
+    cols = {row[1] for row in cur.fetchall()}  # row[1] = column name
+    _COLS_CACHE[table_name] = (version, cols)
+    return cols
 
 def load_menu_items():
     """
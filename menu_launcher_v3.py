@@ -12,6 +12,7 @@ Enhancements:
   • 🪄 MENU_LAUNCHER_MODE env var prevents double "Press ENTER" pauses
 """
 
+import atexit
 import tkinter as tk
 from tkinter import ttk, messagebox
 import sqlite3
@@ -31,12 +32,29 @@ STATUS_FILE = BASE_PATH / "menu_status.txt"
 # ────────────────────────────────
 # Utility functions
 # ────────────────────────────────
+_status_fh = None
+
+
+def _ensure_status_fh():
+    """Open the status file once, on first use; closed at exit."""
+    global _status_fh
+    if _status_fh is None:
+        # Line-buffered: each status line still reaches the file right away, for
+        # anything watching it, without an open/close per message.
+        try:
+            _status_fh = open(STATUS_FILE, "a", encoding="utf-8", buffering=1)
+        except FileNotFoundError:
+            BASE_PATH.mkdir(parents=True, exist_ok=True)
+            _status_fh = open(STATUS_FILE, "a", encoding="utf-8", buffering=1)
+        atexit.register(_status_fh.close)
+    return _status_fh
+
+
 def append_status(msg: str):
     """Append timestamped line to shared status file."""
     try:
-        with open(STATUS_FILE, "a", encoding="utf-8") as f:
-            ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            f.write(f"{ts}  {msg}\n")
+        ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        _ensure_status_fh().write(f"{ts}  {msg}\n")
     except Exception:
         pass
 